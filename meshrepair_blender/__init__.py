@@ -34,6 +34,7 @@ from . import preferences
 from . import properties
 from . import operators
 from . import ui
+from . import utils
 
 
 # Registration
@@ -53,6 +54,9 @@ def register():
     # Register UI
     ui.register()
 
+    # Register app handlers (export cache invalidation)
+    utils.register()
+
     # Attach properties to Scene
     bpy.types.Scene.meshrepair_props = bpy.props.PointerProperty(
         type=properties.MeshRepairSceneProperties
@@ -69,6 +73,7 @@ def unregister():
     del bpy.types.Scene.meshrepair_props
 
     # Unregister in reverse order
+    utils.unregister()
     ui.unregister()
     operators.unregister()
     properties.unregister()
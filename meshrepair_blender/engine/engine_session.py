@@ -226,7 +226,7 @@ class EngineSession:
         Args:
             mesh_data: Dict with 'vertices' and 'faces' keys (mesh soup format)
             selection_info: Optional MeshExportResult with selection metadata:
-                - boundary_vertex_flags: List[bool] marking selection boundary vertices
+                - boundary_vertex_flags: bool ndarray marking selection boundary vertices
                 - For selection mode: helps engine exclude selection boundaries from hole filling
 
         Returns:
@@ -26,23 +26,31 @@ class MESHREPAIR_OT_preset_preprocess(Operator):
         ]
     )
 
+    # Property values applied by each preset
+    _PRESETS = {
+        'LIGHT': {
+            'preprocess_remove_duplicates': True,
+            'preprocess_remove_non_manifold': False,
+            'preprocess_remove_3_face_fans': False,
+            'preprocess_remove_isolated': True,
+            'preprocess_keep_largest': False,
+            'preprocess_nm_passes': 1,  # Not used (non-manifold removal disabled)
+        },
+        'FULL': {
+            'preprocess_remove_duplicates': True,
+            'preprocess_remove_non_manifold': True,
+            'preprocess_remove_3_face_fans': True,
+            'preprocess_remove_isolated': True,
+            'preprocess_keep_largest': False,
+            'preprocess_nm_passes': 10,
+        },
+    }
+
     def execute(self, context):
         props = context.scene.meshrepair_props
 
-        if self.preset == 'LIGHT':
-            props.preprocess_remove_duplicates = True
-            props.preprocess_remove_non_manifold = False
-            props.preprocess_remove_3_face_fans = False
-            props.preprocess_remove_isolated = True
-            props.preprocess_keep_largest = False
-            props.preprocess_nm_passes = 1  # Not used (non-manifold removal disabled)
-        elif self.preset == 'FULL':
-            props.preprocess_remove_duplicates = True
-            props.preprocess_remove_non_manifold = True
-            props.preprocess_remove_3_face_fans = True
-            props.preprocess_remove_isolated = True
-            props.preprocess_keep_largest = False
-            props.preprocess_nm_passes = 10
+        for name, value in self._PRESETS[self.preset].items():
+            setattr(props, name, value)
 
         self.report({'INFO'}, f"Applied {self.preset} preprocessing preset")
         return {'FINISHED'}
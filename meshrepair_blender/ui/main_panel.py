@@ -13,6 +13,11 @@ from bpy.types import Panel
 from ..preferences import get_prefs
 
 
+def _step_box(layout):
+    """Create a boxed, aligned column for one step/preset block."""
+    return layout.box().column(align=True)
+
+
 class MESHREPAIR_PT_Base(Panel):
     """Base class for all Mesh Repair panels"""
     bl_space_type = 'VIEW_3D'
@@ -48,13 +53,7 @@ class MESHREPAIR_PT_EngineStatus(MESHREPAIR_PT_Base):
 
         col = layout.column(align=True)
 
-        if prefs.engine_initialized:
-            box = col.box()
-            box.label(text="Engine: Ready", icon='INFO')
-            if prefs.engine_version:
-                box.label(text=f"Version: {prefs.engine_version}")
-
-        else:
+        if not prefs.engine_initialized:
             box = col.box()
             box.alert = True
             box.label(text="Engine not found!", icon='ERROR')
@@ -62,6 +61,13 @@ class MESHREPAIR_PT_EngineStatus(MESHREPAIR_PT_Base):
 
             col.separator()
             col.operator("meshrepair.detect_engine", icon='VIEWZOOM')
+            return
+
+        box = col.box()
+        box.label(text="Engine: Ready", icon='INFO')
+        engine_version = prefs.engine_version
+        if engine_version:
+            box.label(text=f"Version: {engine_version}")
 
 
 class MESHREPAIR_PT_Main(MESHREPAIR_PT_Base):
@@ -129,37 +135,39 @@ class MESHREPAIR_PT_Main(MESHREPAIR_PT_Base):
 
     def draw_custom_mode(self, layout, props, enabled):
         """Draw individual step buttons for custom mode"""
+        # Read stats once per redraw instead of going through RNA for every check
+        last_preprocess_stats = props.last_preprocess_stats
+        hole_count = props.last_hole_count
+        holes_filled = props.last_holes_filled
+
         col = layout.column(align=True)
         col.enabled = enabled  # Disable all if no mesh
 
         # Step 1: Preprocess
-        box = col.box()
-        box_col = box.column(align=True)
+        box_col = _step_box(col)
         op = box_col.operator("meshrepair.preprocess", icon='MODIFIER', text="Preprocess Mesh")
         op.return_result = True
 
-        if props.last_preprocess_stats:
+        if last_preprocess_stats:
             box_col.label(text=f"✓ Removed {props.last_duplicate_count} duplicates", icon='BLANK1')
 
         # Step 2: Detect
-        box = col.box()
-        box_col = box.column(align=True)
+        box_col = _step_box(col)
         op = box_col.operator("meshrepair.detect_holes", icon='VIEWZOOM', text="Detect Holes")
         op.return_result = True
 
-        if props.last_hole_count > 0:
-            box_col.label(text=f"✓ Found {props.last_hole_count} holes", icon='BLANK1')
+        if hole_count > 0:
+            box_col.label(text=f"✓ Found {hole_count} holes", icon='BLANK1')
 
         # Step 3: Fill
-        box = col.box()
-        box_col = box.column(align=True)
+        box_col = _step_box(col)
         row = box_col.row(align=True)
         row.operator("meshrepair.fill_holes", icon='MOD_TRIANGULATE', text="Fill Holes")
-        if not enabled or props.last_hole_count == 0:
+        if not enabled or hole_count == 0:
             row.enabled = False
 
-        if props.last_holes_filled > 0:
-            box_col.label(text=f"✓ Filled {props.last_holes_filled} holes", icon='BLANK1')
+        if holes_filled > 0:
+            box_col.label(text=f"✓ Filled {holes_filled} holes", icon='BLANK1')
 
     def draw_quick_mode(self, layout, props, enabled):
         """Draw one-click preset buttons for quick mode"""
@@ -167,24 +175,21 @@ class MESHREPAIR_PT_Main(MESHREPAIR_PT_Base):
         col.enabled = enabled  # Disable all if no mesh
 
         # Fast preset
-        box = col.box()
-        box_col = box.column(align=True)
+        box_col = _step_box(col)
         box_col.label(text="Fast Repair", icon='SORTTIME')
         box_col.label(text="C⁰ continuity, no refinement", icon='BLANK1')
         op = box_col.operator("meshrepair.repair_all", text="Repair (Fast)")
         op.preset = 'FAST'
 
         # Quality preset
-        box = col.box()
-        box_col = box.column(align=True)
+        box_col = _step_box(col)
         box_col.label(text="Quality Repair", icon='SHADING_RENDERED')
         box_col.label(text="C¹ continuity, with refinement", icon='BLANK1')
         op = box_col.operator("meshrepair.repair_all", text="Repair (Quality)")
         op.preset = 'QUALITY'
 
         # High quality preset
-        box = col.box()
-        box_col = box.column(align=True)
+        box_col = _step_box(col)
         box_col.label(text="High Quality Repair", icon='MATERIAL')
         box_col.label(text="C² continuity, full refinement", icon='BLANK1')
         op = box_col.operator("meshrepair.repair_all", text="Repair (High Quality)")
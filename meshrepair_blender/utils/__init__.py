@@ -12,5 +12,14 @@ Utility functions for Mesh Repair addon
 """
 
 from .mesh_utils import export_mesh, import_mesh
+from . import mesh_export
 
 __all__ = ['export_mesh', 'import_mesh']
+
+
+def register():
+    mesh_export.register()
+
+
+def unregister():
+    mesh_export.unregister()
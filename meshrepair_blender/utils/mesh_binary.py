@@ -22,6 +22,11 @@ import base64
 import array
 import sys
 
+import numpy as np
+
+_FLOAT32_LE = np.dtype('<f4')
+_UINT32_LE = np.dtype('<u4')
+
 
 def serialize_mesh_binary(mesh_data):
     """
@@ -29,11 +34,11 @@ def serialize_mesh_binary(mesh_data):
 
     Args:
         mesh_data: Dict with 'vertices' and 'faces' keys
-                  vertices: [[x, y, z], ...]
-                  faces: [[i0, i1, i2], ...]
+                  vertices: [[x, y, z], ...] or (N, 3) float32 ndarray
+                  faces: [[i0, i1, i2], ...] or (M, 3) int32/uint32 ndarray
 
     Returns:
-        bytes: Binary mesh data
+        memoryview: Read-only view of the binary mesh data (bytes-like)
     """
     vertices = mesh_data['vertices']
     faces = mesh_data['faces']
@@ -41,28 +46,51 @@ def serialize_mesh_binary(mesh_data):
     vertex_count = len(vertices)
     face_count = len(faces)
 
-    # Flatten using array for contiguous memory and less Python overhead
-    coords = array.array('f', (coord for v in vertices for coord in v))
-    indices = array.array('I', (idx for tri in faces for idx in tri))
-
-    if sys.byteorder != 'little':
-        coords.byteswap()
-        indices.byteswap()
-
-    buffer = bytearray()
-    buffer.extend(struct.pack('<I', vertex_count))
-    buffer.extend(coords.tobytes())
-    buffer.extend(struct.pack('<I', face_count))
-    buffer.extend(indices.tobytes())
-    return bytes(buffer)
-
-
-def deserialize_mesh_binary(binary_data):
+    if isinstance(vertices, np.ndarray) and isinstance(faces, np.ndarray):
+        coords = _flat_le_array(vertices, _FLOAT32_LE)
+        indices = _flat_le_array(faces, _UINT32_LE)
+    else:
+        # Flatten using array for contiguous memory and less Python overhead
+        coords = array.array('f', (coord for v in vertices for coord in v))
+        indices = array.array('I', (idx for tri in faces for idx in tri))
+        if sys.byteorder != 'little':
+            coords.byteswap()
+            indices.byteswap()
+
+    coord_view = memoryview(coords).cast('B')
+    index_view = memoryview(indices).cast('B')
+
+    # Single allocation: no extend() reallocations and no final bytes() copy
+    index_offset = 8 + len(coord_view)
+    buffer = bytearray(index_offset + len(index_view))
+    struct.pack_into('<I', buffer, 0, vertex_count)
+    buffer[4:4 + len(coord_view)] = coord_view
+    struct.pack_into('<I', buffer, 4 + len(coord_view), face_count)
+    buffer[index_offset:] = index_view
+    return memoryview(buffer).toreadonly()
+
+
+def _flat_le_array(data, dtype):
+    """Return data as a flat, C-contiguous little-endian array (no copy when already matching)."""
+    arr = np.asarray(data)
+    if dtype.kind == 'u' and arr.dtype.kind == 'i':
+        # Casting or viewing would silently wrap negatives to huge unsigned values
+        if arr.size and arr.min() < 0:
+            raise ValueError(f"Negative index cannot be stored as unsigned: {int(arr.min())}")
+        if arr.dtype.itemsize == dtype.itemsize:
+            # Reinterpret int32 as uint32 instead of converting
+            arr = arr.view(arr.dtype.str.replace('i', 'u'))
+    return np.ascontiguousarray(arr, dtype=dtype).reshape(-1)
+
+
+def deserialize_mesh_binary(binary_data, as_numpy=True):
     """
     Deserialize mesh from binary format.
 
     Args:
-        binary_data: Binary mesh data (bytes)
+        binary_data: Binary mesh data (bytes-like)
+        as_numpy: Return (N, 3) float32 / (M, 3) uint32 ndarrays viewing binary_data
+                  (default); False returns nested Python lists
 
     Returns:
         dict: Mesh data with 'vertices' and 'faces' keys
@@ -83,10 +111,7 @@ def deserialize_mesh_binary(binary_data):
     if len(mv) < offset + coord_bytes + 4:
         raise ValueError("Binary mesh data truncated (vertices)")
 
-    coords = array.array('f')
-    coords.frombytes(mv[offset:offset + coord_bytes])
-    if sys.byteorder != 'little':
-        coords.byteswap()
+    coords = np.frombuffer(mv, dtype=_FLOAT32_LE, count=coord_count, offset=offset)
     offset += coord_bytes
 
     face_count = struct.unpack_from('<I', mv, offset)[0]
@@ -97,23 +122,21 @@ def deserialize_mesh_binary(binary_data):
     if len(mv) < offset + index_bytes:
         raise ValueError("Binary mesh data truncated (faces)")
 
-    indices = array.array('I')
-    indices.frombytes(mv[offset:offset + index_bytes])
+    indices = np.frombuffer(mv, dtype=_UINT32_LE, count=index_count, offset=offset)
+
     if sys.byteorder != 'little':
-        indices.byteswap()
+        coords = coords.astype(np.float32)
+        indices = indices.astype(np.uint32)
 
-    vertices = [
-        [coords[i], coords[i + 1], coords[i + 2]]
-        for i in range(0, coord_count, 3)
-    ]
+    if index_count and indices.max() >= vertex_count:
+        bad = int(np.flatnonzero(indices >= vertex_count)[0]) // 3 * 3
+        raise ValueError(f"Face index out of range: {indices[bad:bad + 3].tolist()}")
 
-    faces = []
-    for i in range(0, index_count, 3):
-        i0, i1, i2 = indices[i], indices[i + 1], indices[i + 2]
-        if i0 >= vertex_count or i1 >= vertex_count or i2 >= vertex_count:
-            raise ValueError(f"Face index out of range: [{i0}, {i1}, {i2}]")
-        faces.append([i0, i1, i2])
+    vertices = coords.reshape(-1, 3)
+    faces = indices.reshape(-1, 3)
 
+    if not as_numpy:
+        return {'vertices': vertices.tolist(), 'faces': faces.tolist()}
     return {'vertices': vertices, 'faces': faces}
 
 
@@ -131,15 +154,16 @@ def encode_mesh_base64(mesh_data):
     return base64.b64encode(binary_data).decode('ascii')
 
 
-def decode_mesh_base64(base64_string):
+def decode_mesh_base64(base64_string, as_numpy=True):
     """
     Decode base64 string to binary and deserialize mesh.
 
     Args:
         base64_string: Base64-encoded binary mesh
+        as_numpy: Return ndarrays (default) or nested Python lists
 
     Returns:
         dict: Mesh data with 'vertices' and 'faces' keys
     """
     binary_data = base64.b64decode(base64_string)
-    return deserialize_mesh_binary(binary_data)
+    return deserialize_mesh_binary(binary_data, as_numpy=as_numpy)
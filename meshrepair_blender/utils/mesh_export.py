@@ -16,67 +16,137 @@ Exports directly to data structures (no temp files).
 
 import bpy
 import bmesh
-from dataclasses import dataclass, field
+import numpy as np
+from bpy.app.handlers import persistent
+from dataclasses import dataclass, field, replace
 from typing import List, Set, Tuple
+from .mesh_kernels import HAS_NUMBA, boundary_edge_mask, count_edge_components, dilate_face_mask
 
 
 @dataclass
 class MeshExportResult:
     """Container returned by export_mesh_to_data."""
-    mesh_data: dict
+    mesh_data: dict  # 'vertices': (N, 3) float32 ndarray, 'faces': (M, 3) int32 ndarray
     selection_only: bool
     selection_was_empty: bool
     selection_hole_count: int
-    vertex_orig_indices: List[int]
-    boundary_vertex_flags: List[bool]  # Rim boundary flags (hole rim for Selection, user rim for Remesh)
+    vertex_orig_indices: np.ndarray  # int32, original vertex index per exported vertex
+    boundary_vertex_flags: np.ndarray  # bool, rim boundary flags (hole rim for Selection, user rim for Remesh)
     engine_boundary_indices: List[int]  # Guard boundary indices (expanded selection border)
-    face_orig_indices: List[int]
+    face_orig_indices: np.ndarray  # int32, original face indices of the exported scope
     object_bbox_diagonal: float = 0.0  # Bounding box diagonal of the FULL object (not selection)
     faces_to_delete: List[int] = field(default_factory=list)  # Original faces to remove before importing result
     remesh_selection: bool = False  # Whether selection was treated as a hole boundary
 
 
-def _export_mesh_full_fast(obj):
-    """Fast object-mode export using Mesh loop triangles and foreach_get."""
-    mesh = obj.data.copy()
-    try:
-        mesh.calc_loop_triangles()
+# Recent object-mode export results, keyed by object/mesh identity and export options.
+# Cleared whenever geometry or transforms change, on undo/redo/file load, and by mesh import.
+_EXPORT_CACHE = {}
+_EXPORT_CACHE_SIZE = 4
 
-        vertex_count = len(mesh.vertices)
-        tri_count = len(mesh.loop_triangles)
 
-        coords = [0.0] * (vertex_count * 3)
-        mesh.vertices.foreach_get("co", coords)
+def _export_cache_key(obj, selection_only, dilation_iters, remesh_selection):
+    """
+    Build the export cache key, or None if the export must not be cached.
 
-        tri_flat = [0] * (tri_count * 3)
-        mesh.loop_triangles.foreach_get("vertices", tri_flat)
+    Only object-mode exports are cached: edit-mode exports flush the edit mesh and may
+    grow the user's selection (select_more), side effects a cache hit would skip.
+    """
+    if obj.mode != 'OBJECT':
+        return None
+    mesh_uid = getattr(obj.data, "session_uid", None)
+    if mesh_uid is None:
+        return None
 
-        vertices = [coords[i:i + 3] for i in range(0, len(coords), 3)]
-        faces = [tri_flat[i:i + 3] for i in range(0, len(tri_flat), 3)]
+    return (
+        obj.as_pointer(),
+        mesh_uid,
+        bool(selection_only),
+        int(dilation_iters),
+        bool(remesh_selection)
+    )
 
-        object_bbox_diagonal = _compute_object_bbox_diagonal(obj)
 
-        return MeshExportResult(
-            mesh_data={
-                'vertices': vertices,
-                'faces': faces
-            },
-            selection_only=False,
-            selection_was_empty=False,
-            selection_hole_count=0,
-            vertex_orig_indices=list(range(vertex_count)),
-            boundary_vertex_flags=[False] * vertex_count,
-            engine_boundary_indices=[],
-            face_orig_indices=list(range(tri_count)),
-            object_bbox_diagonal=object_bbox_diagonal,
-            faces_to_delete=[],
-            remesh_selection=False
-        )
-    finally:
-        try:
-            bpy.data.meshes.remove(mesh)
-        except Exception:
-            pass
+def clear_export_cache(*_args):
+    """Drop all cached export results."""
+    _EXPORT_CACHE.clear()
+
+
+@persistent
+def _on_depsgraph_update(scene, depsgraph):
+    if not _EXPORT_CACHE:
+        return
+    for update in depsgraph.updates:
+        if update.is_updated_geometry or update.is_updated_transform:
+            _EXPORT_CACHE.clear()
+            return
+
+
+@persistent
+def _on_undo_or_load(*_args):
+    _EXPORT_CACHE.clear()
+
+
+_CACHE_HANDLERS = (
+    ('depsgraph_update_post', _on_depsgraph_update),
+    ('undo_post', _on_undo_or_load),
+    ('redo_post', _on_undo_or_load),
+    ('load_post', _on_undo_or_load),
+)
+
+
+def register():
+    for name, handler in _CACHE_HANDLERS:
+        handlers = getattr(bpy.app.handlers, name)
+        if handler not in handlers:
+            handlers.append(handler)
+
+
+def unregister():
+    for name, handler in _CACHE_HANDLERS:
+        handlers = getattr(bpy.app.handlers, name)
+        if handler in handlers:
+            handlers.remove(handler)
+    _EXPORT_CACHE.clear()
+
+
+def _export_mesh_full_fast(obj, object_bbox_diagonal):
+    """Fast object-mode export using Mesh loop triangles and foreach_get."""
+    # Read straight from obj.data: loop triangles are a derived cache, so no
+    # throwaway copy of the whole mesh is needed to compute them.
+    mesh = obj.data
+    mesh.calc_loop_triangles()
+
+    vertex_count = len(mesh.vertices)
+    tri_count = len(mesh.loop_triangles)
+
+    # Typed buffers let foreach_get memcpy instead of boxing every element.
+    # int32 matches Blender's int properties; the serializer writes them as uint32.
+    coords = np.empty(vertex_count * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", coords)
+
+    tri_flat = np.empty(tri_count * 3, dtype=np.int32)
+    mesh.loop_triangles.foreach_get("vertices", tri_flat)
+
+    vertices = coords.reshape(-1, 3)
+    faces = tri_flat.reshape(-1, 3)
+
+    return MeshExportResult(
+        mesh_data={
+            'vertices': vertices,
+            'faces': faces
+        },
+        selection_only=False,
+        selection_was_empty=False,
+        selection_hole_count=0,
+        vertex_orig_indices=np.arange(vertex_count, dtype=np.int32),
+        boundary_vertex_flags=np.zeros(vertex_count, dtype=np.bool_),
+        engine_boundary_indices=[],
+        face_orig_indices=np.arange(tri_count, dtype=np.int32),
+        object_bbox_diagonal=object_bbox_diagonal,
+        faces_to_delete=[],
+        remesh_selection=False
+    )
 
 
 def export_mesh_to_data(obj, selection_only=False, dilation_iters=0, remesh_selection=False):
@@ -98,9 +168,33 @@ def export_mesh_to_data(obj, selection_only=False, dilation_iters=0, remesh_sele
     if obj.type != 'MESH':
         raise RuntimeError("Object must be MESH type")
 
-    # Fast path for full-mesh/object-mode export: use Mesh foreach_get/loop_triangles.
-    if obj.mode != 'EDIT' and not selection_only:
-        return _export_mesh_full_fast(obj)
+    cache_key = _export_cache_key(obj, selection_only, dilation_iters, remesh_selection)
+    cached = _EXPORT_CACHE.get(cache_key) if cache_key is not None else None
+    if cached is not None:
+        # Shallow copy: import-side remapping reassigns fields on the result it is given
+        return replace(cached)
+
+    result = _export_mesh_to_data_uncached(obj, selection_only, dilation_iters, remesh_selection)
+
+    if cache_key is not None:
+        if len(_EXPORT_CACHE) >= _EXPORT_CACHE_SIZE:
+            _EXPORT_CACHE.pop(next(iter(_EXPORT_CACHE)))
+        _EXPORT_CACHE[cache_key] = result
+        result = replace(result)
+    return result
+
+
+def _export_mesh_to_data_uncached(obj, selection_only, dilation_iters, remesh_selection):
+    """Export implementation behind the export_mesh_to_data cache."""
+    # Object-level value shared by both export paths (for proper hole size ratio in selection mode)
+    object_bbox_diagonal = _compute_object_bbox_diagonal(obj)
+
+    # Fast path for full-mesh export: use Mesh foreach_get/loop_triangles.
+    # In edit mode, flush the edit bmesh to obj.data instead of copying it vertex by vertex.
+    if not selection_only:
+        if obj.mode == 'EDIT':
+            obj.update_from_editmode()
+        return _export_mesh_full_fast(obj, object_bbox_diagonal)
 
     bm = None
     bm_freed = False
@@ -117,81 +211,41 @@ def export_mesh_to_data(obj, selection_only=False, dilation_iters=0, remesh_sele
         
         if obj.mode == 'EDIT':
             bm_edit = bmesh.from_edit_mesh(mesh)
-            bm_edit.verts.ensure_lookup_table()
-            bm_edit.faces.ensure_lookup_table()
-            bm_edit.edges.ensure_lookup_table()
-            
-            bm = bmesh.new()
-            bm_edit.verts.ensure_lookup_table()
-            bm_edit.faces.ensure_lookup_table()
-            
-            vert_map = {}
-            for bm_edit_vert in bm_edit.verts:
-                bm_vert = bm.verts.new(bm_edit_vert.co)
-                vert_map[bm_edit_vert] = bm_vert
-            
-            for bm_edit_face in bm_edit.faces:
-                bm_verts = [vert_map[bm_edit_vert] for bm_edit_vert in bm_edit_face.verts]
-                bm.faces.new(bm_verts)
-            
-            bm.verts.ensure_lookup_table()
-            bm.faces.ensure_lookup_table()
-            bm.edges.ensure_lookup_table()
-            
-            vert_layer = bm.verts.layers.int.new("meshrepair_orig_vert")
-            face_layer = bm.faces.layers.int.new("meshrepair_orig_face")
-            
-            for bm_vert, bm_edit_vert in zip(bm.verts, bm_edit.verts):
-                bm_vert[vert_layer] = bm_edit_vert.index
-            
-            for bm_face, bm_edit_face in zip(bm.faces, bm_edit.faces):
-                bm_face[face_layer] = bm_edit_face.index
+            # Keep BMElem.index in sync with the edit-mesh order the selection indices refer to
+            bm_edit.verts.index_update()
+            bm_edit.faces.index_update()
+
+            # Native copy keeps element order, so each copy's index is its edit-mesh index
+            bm = bm_edit.copy()
+            bm.verts.index_update()
+            bm.faces.index_update()
+
+            # The copy carries over layers left on the mesh by a previous patch import; reuse them
+            vert_layer = bm.verts.layers.int.get("meshrepair_orig_vert")
+            if vert_layer is None:
+                vert_layer = bm.verts.layers.int.new("meshrepair_orig_vert")
+            face_layer = bm.faces.layers.int.get("meshrepair_orig_face")
+            if face_layer is None:
+                face_layer = bm.faces.layers.int.new("meshrepair_orig_face")
+            for bm_vert in bm.verts:
+                bm_vert[vert_layer] = bm_vert.index
+            for bm_face in bm.faces:
+                bm_face[face_layer] = bm_face.index
         else:
             bm = bmesh.new()
             bm.from_mesh(mesh)
-            bm.faces.ensure_lookup_table()
-            bm.edges.ensure_lookup_table()
-            bm.verts.ensure_lookup_table()
 
             vert_layer = bm.verts.layers.int.new("meshrepair_orig_vert")
             face_layer = bm.faces.layers.int.new("meshrepair_orig_face")
-            
-            mesh_verts = mesh.vertices
-            mesh_polys = mesh.polygons
-            
-            coord_to_mesh_idx = {}
-            for i, mesh_vert in enumerate(mesh_verts):
-                co = mesh_vert.co
-                coord_key = (round(co.x, 6), round(co.y, 6), round(co.z, 6))
-                coord_to_mesh_idx[coord_key] = i
-            
-            bm_vert_to_mesh_idx = {}
+
+            # bm.from_mesh keeps mesh vertex order, so the bmesh index is the original index.
+            assert len(bm.verts) == len(mesh.vertices), "bm.from_mesh changed the vertex count"
             for bm_vert in bm.verts:
-                co = bm_vert.co
-                coord_key = (round(co.x, 6), round(co.y, 6), round(co.z, 6))
-                if coord_key in coord_to_mesh_idx:
-                    mesh_idx = coord_to_mesh_idx[coord_key]
-                    bm_vert[vert_layer] = mesh_idx
-                    bm_vert_to_mesh_idx[bm_vert] = mesh_idx
-                else:
-                    bm_vert[vert_layer] = bm_vert.index
-                    bm_vert_to_mesh_idx[bm_vert] = bm_vert.index
-            
-            # Build hash map: frozenset of vertex indices -> polygon index (O(n))
-            poly_vert_hash = {}
-            for poly_idx, poly in enumerate(mesh_polys):
-                key = frozenset(poly.vertices)
-                poly_vert_hash[key] = poly_idx
-
-            # Match bmesh faces to polygon indices using hash lookup (O(n))
+                bm_vert[vert_layer] = bm_vert.index
+
+            # Polygon order is preserved as well, so faces are tagged the same way
             for bm_face in bm.faces:
-                bm_face_vert_indices = frozenset(
-                    bm_vert_to_mesh_idx.get(bm_v, -1) for bm_v in bm_face.verts
-                )
-                if bm_face_vert_indices in poly_vert_hash:
-                    bm_face[face_layer] = poly_vert_hash[bm_face_vert_indices]
-                else:
-                    bm_face[face_layer] = bm_face.index
+                bm_face[face_layer] = bm_face.index
 
         base_selection = _collect_edit_mode_selection(obj) if obj.mode == 'EDIT' else None
         edit_selection = base_selection
@@ -210,84 +264,84 @@ def export_mesh_to_data(obj, selection_only=False, dilation_iters=0, remesh_sele
                 edit_selection = expanded
                 dilation_iters = 0
 
+        # Original face index per bmesh face position, read from the layer once and reused
+        # by the scope and connectivity queries instead of per-face layer lookups.
+        # The face lookup table built here stays valid until _isolate_faces deletes faces.
+        bm.faces.index_update()
+        bm.faces.ensure_lookup_table()
+        face_orig_ids = np.fromiter((face[face_layer] for face in bm.faces), dtype=np.int64, count=len(bm.faces))
+
+        # Edge -> face connectivity of the full mesh, shared by dilation and the hole/boundary queries
+        edge_table = _build_edge_face_table(bm, vert_layer, face_orig_ids)
+
         scoped_face_indices, selection_was_empty, selected_face_indices = _resolve_face_scope(
             bm,
             selection_only and obj.mode == 'EDIT',
             dilation_iters,
             edit_selection,
-            face_layer,
-            select_mode
+            face_orig_ids,
+            select_mode,
+            edge_table=edge_table
         )
 
         if selection_was_empty:
             remesh_selection = False
 
-        faces_to_delete = set()
-        export_face_indices = set(scoped_face_indices)
+        # Face sets are frozen once and shared by every helper below; _EdgeFaceTable caches
+        # the masks and link counts it derives from them, keyed by the (cached) frozenset hash.
+        scoped_face_indices = frozenset(scoped_face_indices)
+        faces_to_delete = frozenset()
+        # For remesh we export only the expanded patch (selection scope) as well.
+        export_face_indices = scoped_face_indices
         selection_hole_count = 0
 
         if selection_only and not selection_was_empty:
             if remesh_selection:
-                base_selected_faces = set(base_selection[0]) if base_selection else set()
-                faces_to_delete = base_selected_faces if base_selected_faces else set(selected_face_indices)
-                # For remesh we export only the expanded patch (selection scope).
-                export_face_indices = set(scoped_face_indices)
+                base_selected_faces = frozenset(base_selection[0].tolist()) if base_selection else frozenset()
+                faces_to_delete = base_selected_faces if base_selected_faces else frozenset(selected_face_indices)
             else:
                 # Selection mode: keep original faces in Blender, just measure holes
-                faces_to_delete = set()
-                selection_hole_count = _count_scoped_holes(bm, export_face_indices, face_layer)
+                selection_hole_count = _count_scoped_holes(edge_table, export_face_indices)
 
         # Avoid empty exports when remeshing covers the whole scoped region
         if remesh_selection and selection_only and not export_face_indices and scoped_face_indices:
-            export_face_indices = set(scoped_face_indices)
-            faces_to_delete = set(export_face_indices)
+            export_face_indices = scoped_face_indices
+            faces_to_delete = export_face_indices
             remesh_selection = False
 
         # Guard: selection border (expanded). Used only by the engine to avoid filling across selection edge.
-        guard_face_indices = set(expanded[0]) if expanded and expanded[0] else export_face_indices
-        topology_boundary_vertices = _compute_topology_boundary_vertices(bm, vert_layer)
+        guard_face_indices = frozenset(expanded[0]) if expanded and expanded[0] else export_face_indices
+        topology_boundary_vertices = _compute_topology_boundary_vertices(edge_table)
         guard_vertex_indices = _compute_boundary_vertices(
-            bm,
+            edge_table,
             guard_face_indices,
-            vert_layer,
-            face_layer,
-            ignored_faces=faces_to_delete if remesh_selection else None
+            ignored_faces=faces_to_delete if remesh_selection else None,
+            excluded_vertices=topology_boundary_vertices
         ) if guard_face_indices else set()
-        guard_vertex_indices = guard_vertex_indices - topology_boundary_vertices
 
         # Rim: actual hole border to be stitched on import.
         rim_vertex_indices: Set[int] = set()
         if selection_only and not selection_was_empty:
             if remesh_selection and faces_to_delete:
-                rim_vertex_indices = _compute_face_set_boundary_vertices(
-                    bm,
-                    faces_to_delete,
-                    face_layer,
-                    vert_layer
-                )
+                rim_vertex_indices = _compute_face_set_boundary_vertices(edge_table, faces_to_delete)
             elif not remesh_selection:
-                rim_vertex_indices = _compute_hole_boundary_vertices(
-                    bm,
-                    export_face_indices,
-                    face_layer,
-                    vert_layer
-                )
+                rim_vertex_indices = _compute_hole_boundary_vertices(edge_table, export_face_indices)
 
         engine_boundary_indices = guard_vertex_indices
-        face_orig_indices = list(export_face_indices)
+        face_orig_indices = np.fromiter(export_face_indices, dtype=np.int32, count=len(export_face_indices))
         faces_to_delete_list = list(faces_to_delete) if faces_to_delete else []
         engine_boundary_indices_list = []
 
-        if faces_to_delete and remesh_selection:
-            faces_to_delete_geom = [face for face in bm.faces if face[face_layer] in faces_to_delete]
-            if faces_to_delete_geom:
-                bmesh.ops.delete(bm, geom=faces_to_delete_geom, context='FACES')
-                bm.faces.ensure_lookup_table()
-                bm.verts.ensure_lookup_table()
-
-        if export_face_indices:
-            _isolate_faces(bm, export_face_indices, face_layer)
-            _remove_isolated_vertices(bm)
+        # Remesh-deleted faces, out-of-scope faces and loose geometry are dropped in a single delete
+        dropped_face_indices = faces_to_delete if remesh_selection else None
+        if export_face_indices or dropped_face_indices:
+            _isolate_faces(
+                bm,
+                export_face_indices or None,
+                face_orig_ids,
+                dropped_face_indices,
+                remove_loose=bool(export_face_indices)
+            )
 
         _triangulate_all(bm)
 
@@ -299,10 +353,11 @@ def export_mesh_to_data(obj, selection_only=False, dilation_iters=0, remesh_sele
 
         # Map guard boundary (selection border) to exported vertex indices expected by the engine
         if engine_boundary_indices:
-            guard_lookup = set(engine_boundary_indices)
-            engine_boundary_indices_list = [
-                idx for idx, orig in enumerate(vertex_orig_indices) if orig in guard_lookup
-            ]
+            guard_lookup = np.fromiter(engine_boundary_indices, dtype=np.int32, count=len(engine_boundary_indices))
+            # Plain ints: the list is sent to the engine as JSON
+            engine_boundary_indices_list = np.flatnonzero(
+                np.isin(vertex_orig_indices, guard_lookup)
+            ).tolist()
 
         bm.free()
         bm_freed = True
@@ -311,9 +366,6 @@ def export_mesh_to_data(obj, selection_only=False, dilation_iters=0, remesh_sele
         actual_selection = bool(selection_only and obj.mode == 'EDIT' and not selection_was_empty)
         remesh_flag = bool(remesh_selection and not selection_was_empty)
 
-        # Calculate object bounding box diagonal (for proper hole size ratio in selection mode)
-        object_bbox_diagonal = _compute_object_bbox_diagonal(obj)
-
         return MeshExportResult(
             mesh_data=mesh_data,
             selection_only=actual_selection,
@@ -339,9 +391,11 @@ def export_mesh_to_data(obj, selection_only=False, dilation_iters=0, remesh_sele
 
 
 def _collect_edit_mode_selection(obj):
-    """Capture edit-mode selections as index sets."""
+    """Capture edit-mode selections (faces as a sorted index array, edges/verts unused)."""
     bm = bmesh.from_edit_mesh(obj.data)
-    faces = {face.index for face in bm.faces if face.select}
+    bm.faces.index_update()
+    face_select = np.fromiter((face.select for face in bm.faces), dtype=np.bool_, count=len(bm.faces))
+    faces = np.flatnonzero(face_select)
     edges = set()
     verts = set()
     return faces, edges, verts
@@ -359,9 +413,6 @@ def _expand_edit_selection_face_step(obj, iterations):
             return None
 
     bm = bmesh.from_edit_mesh(obj.data)
-    bm.faces.ensure_lookup_table()
-    bm.edges.ensure_lookup_table()
-    bm.verts.ensure_lookup_table()
 
     selected_faces = {face.index for face in bm.faces if face.select}
     selected_edges = {edge.index for edge in bm.edges if edge.select}
@@ -389,10 +440,14 @@ def _safe_update_edit_mesh(mesh):
             bmesh.update_edit_mesh(mesh)
 
 
-def _resolve_face_scope(bm, selection_only, dilation_iters, edit_selection, face_layer, select_mode=None):
+def _resolve_face_scope(bm, selection_only, dilation_iters, edit_selection, face_ids, select_mode=None,
+                        edge_table=None):
     """
     Determine which faces to export.
 
+    face_ids holds the original face index of each bmesh face position (BMFace.index).
+    edge_table, when given, provides the connectivity for Numba dilation.
+
     Returns:
         Tuple[Set[int], bool, Set[int]]: (face indices, selection_was_empty, directly selected faces)
     """
@@ -401,28 +456,35 @@ def _resolve_face_scope(bm, selection_only, dilation_iters, edit_selection, face
     selection_was_empty = False
 
     if not selection_only or edit_selection is None:
-        scoped_indices = {face[face_layer] for face in bm.faces}
+        scoped_indices = set(face_ids.tolist())
         return scoped_indices, selection_was_empty, selected_indices
 
     selected_faces, _, _ = edit_selection
 
-    face_lookup = {face[face_layer]: face for face in bm.faces}
-
     selected_indices = set(selected_faces)
 
     if not selected_indices:
         selection_was_empty = True
-        scoped_indices = {face[face_layer] for face in bm.faces}
+        scoped_indices = set(face_ids.tolist())
         return scoped_indices, selection_was_empty, set()
 
-    selected_face_objs = {face_lookup[idx] for idx in selected_indices if idx in face_lookup}
-    scoped_face_objs = set(selected_face_objs)
+    selected_mask = np.isin(face_ids, np.fromiter(selected_indices, dtype=np.int64, count=len(selected_indices)))
+    selected_positions = np.flatnonzero(selected_mask)
+    bm_faces = bm.faces
+    selected_face_objs = {bm_faces[pos] for pos in selected_positions.tolist()}
+    selected_indices = set(face_ids[selected_positions].tolist())
+
+    if dilation_iters <= 0:
+        return set(selected_indices), selection_was_empty, selected_indices
 
-    if dilation_iters > 0:
-        scoped_face_objs = _dilate_face_set(scoped_face_objs, dilation_iters)
+    if HAS_NUMBA and edge_table is not None:
+        offsets, neighbors = edge_table.face_adjacency(len(face_ids))
+        scoped_mask = dilate_face_mask(selected_mask, offsets, neighbors, dilation_iters)
+        scoped_indices = set(face_ids[scoped_mask].tolist())
+        return scoped_indices, selection_was_empty, selected_indices
 
-    scoped_indices = {face[face_layer] for face in scoped_face_objs}
-    selected_indices = {face[face_layer] for face in selected_face_objs}
+    scoped_face_objs = _dilate_face_set(selected_face_objs, dilation_iters)
+    scoped_indices = set(face_ids[[face.index for face in scoped_face_objs]].tolist())
     return scoped_indices, selection_was_empty, selected_indices
 
 
@@ -446,190 +508,315 @@ def _dilate_face_set(initial_faces, dilation_iters):
 
 def _compute_object_bbox_diagonal(obj):
     """Compute the bounding box diagonal of the full object."""
-    import math
-    from mathutils import Vector
-
     # Use Blender's bound_box which gives 8 corners of the object-space bbox
     if hasattr(obj, 'bound_box') and obj.bound_box:
-        corners = [obj.matrix_world @ Vector(obj.bound_box[i][:]) for i in range(8)]
-        if corners:
-            min_corner = [min(c[i] for c in corners) for i in range(3)]
-            max_corner = [max(c[i] for c in corners) for i in range(3)]
-            diagonal = math.sqrt(sum((max_corner[i] - min_corner[i])**2 for i in range(3)))
-            return diagonal
+        local_corners = np.asarray(obj.bound_box, dtype=np.float64).reshape(-1, 3)
+        matrix = np.asarray(obj.matrix_world, dtype=np.float64)
+        corners = local_corners @ matrix[:3, :3].T + matrix[:3, 3]
+        span = corners.max(axis=0) - corners.min(axis=0)
+        return float(np.linalg.norm(span))
 
     return 0.0
 
 
-def _compute_boundary_vertices(bm, scoped_face_indices, vert_layer, face_layer, ignored_faces=None):
-    """Return original vertex indices that lie on the selection boundary (faces in vs out of scope)."""
-    scoped = set(scoped_face_indices)
-    ignored = set(ignored_faces) if ignored_faces else set()
-    boundary = set()
+@dataclass
+class _EdgeFaceTable:
+    """Edge -> linked-face connectivity in original indices, flattened to CSR arrays."""
+    edge_verts: np.ndarray  # (E, 2) original vertex indices
+    offsets: np.ndarray  # (E + 1,) offsets into face_ids
+    face_ids: np.ndarray  # original face index of every edge/face link
+    link_edges: np.ndarray  # edge index of every edge/face link
+    link_counts: np.ndarray  # (E,) number of linked faces per edge
+    link_faces: np.ndarray  # BMFace.index of every edge/face link
+    open_edges: np.ndarray  # (E,) bool, edges with fewer than two linked faces (topology boundary)
+    _cache: dict = field(default_factory=dict, repr=False)  # derived masks/counts per face set
+
+    def face_mask(self, indices, *others):
+        """Bool mask over original face indices, sized to cover the table and all given index sets."""
+        size = int(self.face_ids.max()) + 1 if len(self.face_ids) else 0
+        for group in (indices,) + others:
+            if group:
+                size = max(size, max(group) + 1)
+        if not isinstance(indices, frozenset):
+            return _index_mask(indices, size)
+        key = ('mask', indices, size)
+        if key not in self._cache:
+            self._cache[key] = _index_mask(indices, size)
+        return self._cache[key]
+
+    def count_linked_in(self, face_indices):
+        """Per-edge number of linked faces in face_indices (cached for frozensets)."""
+        if not isinstance(face_indices, frozenset):
+            return self.count_linked(self.face_mask(face_indices))
+        key = ('count', face_indices)
+        if key not in self._cache:
+            self._cache[key] = self.count_linked(self.face_mask(face_indices))
+        return self._cache[key]
+
+    def count_linked(self, face_mask):
+        """Per-edge number of linked faces set in face_mask."""
+        return np.bincount(
+            self.link_edges,
+            weights=face_mask[self.face_ids],
+            minlength=len(self.link_counts)
+        ).astype(np.int32)
+
+    def face_adjacency(self, face_count):
+        """
+        Face -> edge-adjacent face connectivity as CSR arrays of face positions.
+
+        Every pair of distinct links on the same edge becomes a neighbor entry, generated
+        with NumPy from the link arrays rather than a second walk over bm.faces.
+
+        Returns:
+            Tuple[ndarray, ndarray]: ((F + 1,) int32 offsets, int32 adjacent face positions)
+        """
+        link_count = len(self.link_faces)
+        pairs_per_link = self.link_counts[self.link_edges].astype(np.int64)
+        src_link = np.repeat(np.arange(link_count, dtype=np.int64), pairs_per_link)
+        # Offset of each pair within its source link's run, used to walk the edge's links
+        run_starts = np.repeat(np.cumsum(pairs_per_link) - pairs_per_link, pairs_per_link)
+        dst_link = (
+            np.repeat(self.offsets[self.link_edges].astype(np.int64), pairs_per_link)
+            + np.arange(len(src_link), dtype=np.int64) - run_starts
+        )
+        keep = dst_link != src_link
+        src = self.link_faces[src_link[keep]]
+        dst = self.link_faces[dst_link[keep]]
+
+        order = np.argsort(src, kind='stable')
+        offsets = np.zeros(face_count + 1, dtype=np.int32)
+        np.cumsum(np.bincount(src, minlength=face_count), out=offsets[1:])
+        return offsets, dst[order].astype(np.int32)
+
+    def vertices_of(self, edge_mask):
+        """Original vertex indices touched by the masked edges."""
+        return set(self.edge_verts[edge_mask].ravel().tolist())
+
+
+def _build_edge_face_table(bm, vert_layer, face_orig_ids):
+    """
+    Read edge -> linked-face connectivity of bm once into an _EdgeFaceTable.
+
+    Linked faces are collected by BMFace.index and mapped to original indices through
+    face_orig_ids in one NumPy gather, so the face layer is never read per edge.
+    """
+    edge_verts = []
+    offsets = [0]
+    face_positions = []
     for edge in bm.edges:
-        linked = edge.link_faces
-        if len(linked) < 1:
-            continue
-        in_scope = False
-        out_scope = False
-        for face in linked:
-            f_idx = face[face_layer]
-            if f_idx in ignored:
-                continue
-            if f_idx in scoped:
-                in_scope = True
-            else:
-                out_scope = True
-        if in_scope and out_scope:
-            for vert in edge.verts:
-                boundary.add(vert[vert_layer])
+        v0, v1 = edge.verts
+        edge_verts.append((v0[vert_layer], v1[vert_layer]))
+        face_positions.extend(face.index for face in edge.link_faces)
+        offsets.append(len(face_positions))
+    link_faces = np.asarray(face_positions, dtype=np.int64)
+    face_ids = face_orig_ids[link_faces].astype(np.int32)
+
+    offsets = np.asarray(offsets, dtype=np.int32)
+    link_counts = np.diff(offsets)
+    return _EdgeFaceTable(
+        edge_verts=np.asarray(edge_verts, dtype=np.int32).reshape(-1, 2),
+        offsets=offsets,
+        face_ids=np.asarray(face_ids, dtype=np.int32),
+        link_edges=np.repeat(np.arange(len(link_counts), dtype=np.int32), link_counts),
+        link_counts=link_counts,
+        link_faces=link_faces,
+        open_edges=link_counts < 2
+    )
+
+
+def _index_mask(indices, size):
+    """Bool mask of length size with the given indices set."""
+    mask = np.zeros(size, dtype=np.bool_)
+    if indices:
+        mask[np.fromiter(indices, dtype=np.int64, count=len(indices))] = True
+    return mask
+
+
+def _compute_boundary_vertices(edge_table, scoped_face_indices, ignored_faces=None, excluded_vertices=None):
+    """
+    Return original vertex indices that lie on the selection boundary (faces in vs out of scope).
+
+    Open edges cannot straddle the scope and are skipped up front using the table's
+    precomputed topology mask; excluded_vertices (e.g. topology boundary vertices) are
+    removed from the result.
+    """
+    scoped_mask = edge_table.face_mask(scoped_face_indices, ignored_faces)
+    ignored_mask = edge_table.face_mask(ignored_faces, scoped_face_indices)
+
+    if HAS_NUMBA:
+        edge_mask = boundary_edge_mask(edge_table.offsets, edge_table.face_ids, scoped_mask, ignored_mask)
+    else:
+        in_scope = edge_table.count_linked(scoped_mask & ~ignored_mask)
+        out_scope = edge_table.count_linked(~scoped_mask & ~ignored_mask)
+        edge_mask = (in_scope > 0) & (out_scope > 0)
+    edge_mask &= ~edge_table.open_edges
+
+    boundary = edge_table.vertices_of(edge_mask)
+    if excluded_vertices:
+        boundary.difference_update(excluded_vertices)
     return boundary
 
 
-def _compute_hole_boundary_vertices(bm, scoped_face_indices, face_layer, vert_layer):
+def _compute_hole_boundary_vertices(edge_table, scoped_face_indices):
     """
     Return original vertex indices on real hole borders within the scoped faces (edges with a single in-scope face).
     """
-    scoped = set(scoped_face_indices)
-    boundary_edges = []
-    for edge in bm.edges:
-        linked_in_scope = [face for face in edge.link_faces if face[face_layer] in scoped]
-        if len(edge.link_faces) == 1 and len(linked_in_scope) == 1:
-            boundary_edges.append(edge)
-
-    boundary = set()
-    for edge in boundary_edges:
-        for vert in edge.verts:
-            boundary.add(vert[vert_layer])
-    return boundary
+    return edge_table.vertices_of(_hole_edge_mask(edge_table, scoped_face_indices))
 
 
-def _compute_face_set_boundary_vertices(bm, face_indices, face_layer, vert_layer):
+def _hole_edge_mask(edge_table, scoped_face_indices):
+    """Open edges (one linked face) whose face is in scope."""
+    in_scope = edge_table.count_linked_in(scoped_face_indices)
+    return (edge_table.link_counts == 1) & (in_scope == 1)
+
+
+def _compute_face_set_boundary_vertices(edge_table, face_indices):
     """
     Return original vertex indices on the boundary of a face set (adjacent to non-set faces or open edges).
     Used to capture the user-selected rim before expansion/deletion in remesh mode.
     """
-    face_ids = set(face_indices)
-    boundary = set()
-    for edge in bm.edges:
-        linked = edge.link_faces
-        if not linked:
-            continue
-        in_count = 0
-        for face in linked:
-            if face[face_layer] in face_ids:
-                in_count += 1
-        if in_count == 0:
-            continue
-        out_count = len(linked) - in_count
-        if out_count > 0 or len(linked) < 2:
-            for vert in edge.verts:
-                boundary.add(vert[vert_layer])
-    return boundary
+    in_count = edge_table.count_linked_in(face_indices)
+    link_counts = edge_table.link_counts
+    edge_mask = (in_count > 0) & ((link_counts - in_count > 0) | (link_counts < 2))
+    return edge_table.vertices_of(edge_mask)
 
 
-def _compute_topology_boundary_vertices(bm, vert_layer):
+def _compute_topology_boundary_vertices(edge_table):
     """Return original vertex indices that lie on true mesh boundaries (missing adjacent faces)."""
-    boundary = set()
-    for edge in bm.edges:
-        if len(edge.link_faces) < 2:
-            for vert in edge.verts:
-                boundary.add(vert[vert_layer])
-    return boundary
-
+    return edge_table.vertices_of(edge_table.open_edges)
 
-def _isolate_faces(bm, scoped_face_indices, face_layer):
-    """Delete faces outside the scoped set."""
-    faces_to_delete = [face for face in bm.faces if face[face_layer] not in scoped_face_indices]
-    if faces_to_delete:
-        bmesh.ops.delete(bm, geom=faces_to_delete, context='FACES')
-        bm.faces.ensure_lookup_table()
-        bm.verts.ensure_lookup_table()
 
+def _isolate_faces(bm, scoped_face_indices, face_ids, dropped_face_indices=None, remove_loose=False):
+    """
+    Delete faces outside the scoped set, plus any explicitly dropped faces, in one bmesh.ops.delete.
 
-def _remove_isolated_vertices(bm):
-    """Remove vertices that are no longer referenced by any face."""
-    unused = [vert for vert in bm.verts if not vert.link_faces]
-    if unused:
-        bmesh.ops.delete(bm, geom=unused, context='VERTS')
-        bm.verts.ensure_lookup_table()
+    Args:
+        bm: BMesh to modify in-place
+        scoped_face_indices: Original face indices to keep, or None to keep all
+        face_ids: Original face index per bmesh face position (bm must not have lost faces since)
+        dropped_face_indices: Optional original face indices to delete even if scoped
+        remove_loose: Also delete vertices left without faces (wire edges included)
+    """
+    geom = []
+    if dropped_face_indices or (
+        scoped_face_indices is not None and len(scoped_face_indices) < len(bm.faces)
+    ):
+        # Membership as bool-mask lookups over original face indices rather than per-face set probes
+        size = int(face_ids.max()) + 1 if len(face_ids) else 0
+        delete_mask = np.zeros(len(face_ids), dtype=np.bool_)
+        if scoped_face_indices is not None:
+            delete_mask |= ~_index_mask(scoped_face_indices, max(size, max(scoped_face_indices, default=-1) + 1))[face_ids]
+        if dropped_face_indices:
+            delete_mask |= _index_mask(dropped_face_indices, max(size, max(dropped_face_indices) + 1))[face_ids]
+
+        bm_faces = bm.faces
+        geom = [bm_faces[pos] for pos in np.flatnonzero(delete_mask).tolist()]
+
+    if remove_loose:
+        # 'FACES' context already removes verts/edges used only by deleted faces. Tagging the
+        # pre-existing loose verts and wire edges as well lets the same call drop them, so no
+        # second delete pass is needed.
+        geom.extend(vert for vert in bm.verts if not vert.link_faces)
+        geom.extend(edge for edge in bm.edges if not edge.link_faces)
+
+    if geom:
+        bmesh.ops.delete(bm, geom=geom, context='FACES')
 
 
 def _triangulate_all(bm):
     """Triangulate all faces in-place."""
     if bm.faces:
         bmesh.ops.triangulate(bm, faces=bm.faces[:])
-        bm.faces.ensure_lookup_table()
-        bm.verts.ensure_lookup_table()
 
 
-def _count_scoped_holes(bm, scoped_face_indices, face_layer):
+def _count_scoped_holes(edge_table, scoped_face_indices):
     """
     Count boundary edge loops that belong to the scoped faces (real holes inside the selection).
     Edges shared with out-of-scope faces are ignored so selection borders are not treated as holes.
     """
-    scoped = set(scoped_face_indices)
-    boundary_edges = []
-    for edge in bm.edges:
-        linked_in_scope = [face for face in edge.link_faces if face[face_layer] in scoped]
-        if len(edge.link_faces) == 1 and len(linked_in_scope) == 1:
-            boundary_edges.append(edge)
-
-    if not boundary_edges:
+    boundary_edges = edge_table.edge_verts[_hole_edge_mask(edge_table, scoped_face_indices)]
+    if not len(boundary_edges):
         return 0
 
+    if HAS_NUMBA:
+        # Every vertex here touches a boundary edge, so vertex components equal edge loops
+        unique_verts, compact = np.unique(boundary_edges, return_inverse=True)
+        return int(count_edge_components(compact.reshape(-1, 2).astype(np.int64), len(unique_verts)))
+
+    boundary_edges = boundary_edges.tolist()
+
     vert_to_edges = {}
-    for edge in boundary_edges:
-        for vert in edge.verts:
-            vert_to_edges.setdefault(vert, set()).add(edge)
+    for edge_idx, (v0, v1) in enumerate(boundary_edges):
+        vert_to_edges.setdefault(v0, []).append(edge_idx)
+        vert_to_edges.setdefault(v1, []).append(edge_idx)
 
-    visited = set()
+    visited = [False] * len(boundary_edges)
     loops = 0
-    for edge in boundary_edges:
-        if edge in visited:
+    for start in range(len(boundary_edges)):
+        if visited[start]:
             continue
         loops += 1
-        stack = [edge]
+        stack = [start]
         while stack:
             e = stack.pop()
-            if e in visited:
+            if visited[e]:
                 continue
-            visited.add(e)
-            for vert in e.verts:
-                for neighbor in vert_to_edges.get(vert, []):
-                    if neighbor not in visited:
+            visited[e] = True
+            for vert in boundary_edges[e]:
+                for neighbor in vert_to_edges[vert]:
+                    if not visited[neighbor]:
                         stack.append(neighbor)
     return loops
 
 
 def _serialize_bmesh(bm, boundary_vertex_indices, vert_layer):
-    """Serialize bmesh into mesh soup plus metadata."""
-    vertex_orig_indices = []
-    boundary_flags = []
-    vertices = []
-    vertex_lookup = {}
-
-    bm.verts.ensure_lookup_table()
-    bm.faces.ensure_lookup_table()
-
-    for vert in bm.verts:
-        idx = len(vertices)
-        vertex_lookup[vert] = idx
-        vertices.append([vert.co.x, vert.co.y, vert.co.z])
-        original_index = vert[vert_layer]
-        vertex_orig_indices.append(original_index)
-        boundary_flags.append(original_index in boundary_vertex_indices)
-
-    faces = []
-    for face in bm.faces:
-        face_indices = [vertex_lookup[vert] for vert in face.verts]
-        if len(face_indices) == 3:
-            faces.append(face_indices)
+    """
+    Serialize bmesh into mesh soup plus metadata.
+
+    The bmesh is written to a temporary Mesh with bm.to_mesh (a C-level copy) so that
+    coordinates, triangle corners and the original-index layer can be read with typed
+    foreach_get calls instead of iterating BMesh elements in Python.
+    """
+    temp_mesh = bpy.data.meshes.new("meshrepair_serialize")
+    try:
+        bm.to_mesh(temp_mesh)
+        vertex_count = len(temp_mesh.vertices)
+
+        coords = np.empty(vertex_count * 3, dtype=np.float32)
+        temp_mesh.vertices.foreach_get("co", coords)
+
+        # _triangulate_all leaves only triangles and to_mesh writes loops face by face,
+        # so the loop vertex indices are the flat triangle buffer.
+        faces_flat = np.empty(len(temp_mesh.loops), dtype=np.int32)
+        temp_mesh.loops.foreach_get("vertex_index", faces_flat)
+
+        vertex_orig_indices = np.empty(vertex_count, dtype=np.int32)
+        orig_attribute = temp_mesh.attributes.get(vert_layer.name)
+        if orig_attribute is not None and orig_attribute.data_type == 'INT' and orig_attribute.domain == 'POINT':
+            orig_attribute.data.foreach_get("value", vertex_orig_indices)
+        else:
+            # Older Blender without generic int attributes: read the layer from the bmesh
+            vertex_orig_indices[:] = np.fromiter(
+                (vert[vert_layer] for vert in bm.verts),
+                dtype=np.int32,
+                count=vertex_count
+            )
+    finally:
+        bpy.data.meshes.remove(temp_mesh)
+
+    if boundary_vertex_indices:
+        boundary_flags = np.isin(
+            vertex_orig_indices,
+            np.fromiter(boundary_vertex_indices, dtype=np.int32, count=len(boundary_vertex_indices))
+        )
+    else:
+        boundary_flags = np.zeros(vertex_count, dtype=np.bool_)
 
     return (
         {
-            'vertices': vertices,
-            'faces': faces
+            'vertices': coords.reshape(-1, 3),
+            'faces': faces_flat.reshape(-1, 3)
         },
         vertex_orig_indices,
         boundary_flags
@@ -16,7 +16,19 @@ Direct data import (no temp files).
 
 import bpy
 import bmesh
-from .mesh_export import MeshExportResult
+import numpy as np
+import time
+from itertools import chain
+from .mesh_export import MeshExportResult, clear_export_cache
+
+try:
+    from scipy.spatial import cKDTree
+    HAS_SCIPY = True
+except ImportError:
+    cKDTree = None
+    HAS_SCIPY = False
+
+__all__ = ['import_mesh_from_data']
 
 
 def import_mesh_from_data(mesh_data, target_obj, replace=True, selection_info: MeshExportResult = None):
@@ -25,8 +37,8 @@ def import_mesh_from_data(mesh_data, target_obj, replace=True, selection_info: M
 
     Args:
         mesh_data: Dict with 'vertices' and 'faces' keys
-            vertices: List of [x, y, z] coords
-            faces: List of [i0, i1, i2, ...] polygon indices
+            vertices: (N, 3) ndarray or list of [x, y, z] coords
+            faces: (M, 3) triangle ndarray or list of [i0, i1, i2, ...] polygon indices
         target_obj: Target Blender object
         replace: Replace existing mesh data (True)
         selection_info: MeshExportResult metadata when merging selection patches
@@ -38,6 +50,9 @@ def import_mesh_from_data(mesh_data, target_obj, replace=True, selection_info: M
         RuntimeError: If import fails
     """
     try:
+        # The mesh is about to be rewritten; cached exports of it would be stale
+        clear_export_cache()
+
         vertices = mesh_data['vertices']
         faces = mesh_data['faces']
 
@@ -86,13 +101,21 @@ def _replace_mesh_fast(mesh, vertices, faces_tri):
     """Fast full-mesh replace using Mesh foreach_set (no BMesh/from_pydata)."""
     mesh.clear_geometry()
 
-    vertices_seq = list(vertices)
+    # Uniform triangle input (ndarray or list) skips the per-face Python passes below
+    try:
+        faces_arr = np.asarray(faces_tri, dtype=np.int32)
+    except (ValueError, TypeError):
+        faces_arr = None  # ragged polygon list
+    if faces_arr is not None and faces_arr.ndim == 2 and faces_arr.shape[1] == 3:
+        _replace_mesh_triangles(mesh, vertices, faces_arr)
+        return
+
     faces_seq = [list(f) for f in faces_tri]
 
     # Filter out degenerate faces and guard against empty results.
     faces_seq = [f for f in faces_seq if len(f) >= 3]
 
-    vertex_count = len(vertices_seq)
+    vertex_count = len(vertices)
     poly_count = len(faces_seq)
 
     if vertex_count == 0 or poly_count == 0:
@@ -100,114 +123,204 @@ def _replace_mesh_fast(mesh, vertices, faces_tri):
         return
 
     # Support arbitrary polygon sizes (engine typically returns tris/quads).
-    loop_totals = [len(face) for face in faces_seq]
-    loop_count = sum(loop_totals)
+    loop_totals = np.fromiter(map(len, faces_seq), dtype=np.int32, count=poly_count)
+    loop_count = int(loop_totals.sum())
 
     mesh.vertices.add(vertex_count)
     mesh.loops.add(loop_count)
     mesh.polygons.add(poly_count)
 
-    flat_coords = [coord for v in vertices_seq for coord in v]
-    mesh.vertices.foreach_set("co", flat_coords)
+    # float32 buffer: foreach_set copies it in one memcpy instead of converting per element
+    flat_coords = np.asarray(vertices, dtype=np.float32).reshape(-1)
+    _set_vertex_positions(mesh, flat_coords)
 
-    loop_vertex_index = [idx for face in faces_seq for idx in face]
-    loop_start = []
-    running = 0
-    for total in loop_totals:
-        loop_start.append(running)
-        running += total
+    # int32 buffers match Blender's int properties, so each foreach_set is a single copy
+    loop_vertex_index = np.fromiter(chain.from_iterable(faces_seq), dtype=np.int32, count=loop_count)
+    loop_start = np.zeros(poly_count, dtype=np.int32)
+    np.cumsum(loop_totals[:-1], out=loop_start[1:])
 
     mesh.loops.foreach_set("vertex_index", loop_vertex_index)
     mesh.polygons.foreach_set("loop_start", loop_start)
     mesh.polygons.foreach_set("loop_total", loop_totals)
 
-    mesh.validate(verbose=False)
+    # validate() returns True only when it had to correct something
+    corrected = mesh.validate(verbose=False)
     mesh.update(calc_edges=True, calc_edges_loose=True)
 
-    # Fallback: if no polygons were created (Blender rejected data), rebuild via from_pydata.
-    if len(mesh.polygons) == 0 and faces_seq:
+    # Fallback: if validation dropped every polygon (Blender rejected data), rebuild via from_pydata.
+    if corrected and len(mesh.polygons) == 0:
         mesh.clear_geometry()
-        mesh.from_pydata(vertices_seq, [], faces_seq)
+        mesh.from_pydata(flat_coords.reshape(-1, 3).tolist(), [], faces_seq)
         mesh.validate(verbose=False)
         mesh.update(calc_edges=True, calc_edges_loose=True)
 
 
+def _replace_mesh_triangles(mesh, vertices, faces):
+    """Fill a cleared mesh from (N, 3) vertex and (M, 3) triangle ndarrays."""
+    vertex_count = len(vertices)
+    tri_count = len(faces)
+
+    if vertex_count == 0 or tri_count == 0:
+        mesh.update(calc_edges=True)
+        return
+
+    # foreach_set memcpys when the buffer type matches the property (float32 co, int32 indices)
+    coords = np.ascontiguousarray(vertices, dtype=np.float32).reshape(-1)
+    loop_vertex_index = np.ascontiguousarray(faces, dtype=np.int32).reshape(-1)
+
+    mesh.vertices.add(vertex_count)
+    mesh.loops.add(tri_count * 3)
+    mesh.polygons.add(tri_count)
+
+    _set_vertex_positions(mesh, coords)
+    mesh.loops.foreach_set("vertex_index", loop_vertex_index)
+    mesh.polygons.foreach_set("loop_start", np.arange(0, tri_count * 3, 3, dtype=np.int32))
+    mesh.polygons.foreach_set("loop_total", np.full(tri_count, 3, dtype=np.int32))
+
+    # validate() rescans the whole topology; only run it when a cheap array check finds
+    # indices it would have to repair (out of range or repeated within a triangle).
+    tris = loop_vertex_index.reshape(-1, 3)
+    corrected = False
+    if (
+        loop_vertex_index.min() < 0
+        or loop_vertex_index.max() >= vertex_count
+        or np.any((tris[:, 0] == tris[:, 1]) | (tris[:, 1] == tris[:, 2]) | (tris[:, 0] == tris[:, 2]))
+    ):
+        corrected = mesh.validate(verbose=False)
+    # Engine output is a triangle soup without wire edges, so loose-edge detection is skipped
+    mesh.update(calc_edges=True)
+
+    # Fallback: if validation dropped every polygon (Blender rejected data), rebuild via from_pydata.
+    if corrected and len(mesh.polygons) == 0:
+        mesh.clear_geometry()
+        mesh.from_pydata(coords.reshape(-1, 3).tolist(), [], tris.tolist())
+        mesh.validate(verbose=False)
+        mesh.update(calc_edges=True, calc_edges_loose=True)
+
+
+def _set_vertex_positions(mesh, flat_coords):
+    """Upload a flat float32 coordinate buffer to freshly added vertices."""
+    try:
+        # Writes the position attribute directly, bypassing the MeshVertex.co wrapper
+        mesh.attributes["position"].data.foreach_set("vector", flat_coords)
+    except KeyError:
+        # Blender < 3.5 has no generic position attribute
+        mesh.vertices.foreach_set("co", flat_coords)
+
+
 def _patch_selection(mesh_data, target_obj, selection_info: MeshExportResult):
     """Merge repaired selection patch back into the original mesh."""
     if not selection_info or not selection_info.selection_only:
         raise RuntimeError("Selection patch requested without selection metadata")
 
+    clear_export_cache()
     mesh = target_obj.data
+    # Original coordinates, indexed like meshrepair_orig_vert after the refresh below
+    mesh_co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", mesh_co)
+    mesh_co = mesh_co.reshape(-1, 3)
+
+    # Always refresh to current indexing to avoid stale mappings after user edits.
+    # Written on the mesh so from_mesh carries them into the BMesh int layers.
+    _write_index_attribute(mesh, "meshrepair_orig_vert", 'POINT')
+    _write_index_attribute(mesh, "meshrepair_orig_face", 'FACE')
+    # The session layer persists between runs; only reset the faces tagged by the previous run
+    prev_session_id = target_obj.get("_meshrepair_prev_session")
+    session_attr = mesh.attributes.get("meshrepair_session_id")
+    if prev_session_id is not None and session_attr is not None:
+        session_ids = np.empty(len(session_attr.data), dtype=np.int32)
+        session_attr.data.foreach_get("value", session_ids)
+        stale = session_ids == prev_session_id
+        if stale.any():
+            session_ids[stale] = 0
+            session_attr.data.foreach_set("value", session_ids)
+
     bm = bmesh.new()
     bm_freed = False
     try:
         bm.from_mesh(mesh)
-        bm.verts.ensure_lookup_table()
+        # Only bm.faces is subscripted (face deletion below); everything else iterates
         bm.faces.ensure_lookup_table()
 
-        vert_layer = bm.verts.layers.int.get("meshrepair_orig_vert")
-        if vert_layer is None:
-            vert_layer = bm.verts.layers.int.new("meshrepair_orig_vert")
-        # Always refresh to current indexing to avoid stale mappings after user edits
-        for vert in bm.verts:
-            vert[vert_layer] = vert.index
-
-        face_layer = bm.faces.layers.int.get("meshrepair_orig_face")
-        if face_layer is None:
-            face_layer = bm.faces.layers.int.new("meshrepair_orig_face")
-            bm.faces.ensure_lookup_table()
-        # Always refresh to current indexing to avoid stale mappings after user edits
-        for face in bm.faces:
-            face[face_layer] = face.index
-
-        # Session tagging to isolate selections between runs
-        session_layer = bm.faces.layers.int.get("meshrepair_session_id")
-        if session_layer is None:
-            session_layer = bm.faces.layers.int.new("meshrepair_session_id")
+        vert_layer = bm.verts.layers.int["meshrepair_orig_vert"]
+        face_layer = bm.faces.layers.int["meshrepair_orig_face"]
+
+        # Session tagging to isolate selections between runs (written after to_mesh)
+        if bm.faces.layers.int.get("meshrepair_session_id") is None:
+            bm.faces.layers.int.new("meshrepair_session_id")
         # Use a bounded session id that fits into Blender's int custom data (C int)
-        import time
         current_session_id = int(time.time() * 1000) & 0x7FFFFFFF
 
-        faces_to_remove = set(getattr(selection_info, "faces_to_delete", []) or [])
+        faces_to_remove = getattr(selection_info, "faces_to_delete", None) or ()
         if selection_info.selection_only and not getattr(selection_info, "remesh_selection", False):
-            faces_to_remove.clear()  # Selection mode: keep original faces, only add filled holes
+            faces_to_remove = ()  # Selection mode: keep original faces, only add filled holes
         elif not faces_to_remove:
-            faces_to_remove = set(selection_info.face_orig_indices)
+            faces_to_remove = selection_info.face_orig_indices
 
-        if faces_to_remove:
-            faces_to_delete = [face for face in bm.faces if face[face_layer] in faces_to_remove]
+        if len(faces_to_remove):
+            remove_ids = np.fromiter(faces_to_remove, dtype=np.int64, count=len(faces_to_remove))
+            # meshrepair_orig_face was just reset to each face's index, so no per-face layer read
+            delete_mask = np.isin(np.arange(len(bm.faces)), remove_ids)
+            faces_to_delete = [bm.faces[i] for i in np.flatnonzero(delete_mask).tolist()]
             if faces_to_delete:
                 bmesh.ops.delete(bm, geom=faces_to_delete, context='FACES')
 
-        bm.verts.ensure_lookup_table()
-        bm.faces.ensure_lookup_table()
-
-        index_lookup = {vert[vert_layer]: vert for vert in bm.verts}
-        vertex_map = {}
+        # Read the surviving original ids once; dict(zip()) builds the map in C
+        remaining_ids = np.fromiter((vert[vert_layer] for vert in bm.verts), dtype=np.int32, count=len(bm.verts))
+        index_lookup = dict(zip(remaining_ids.tolist(), bm.verts))
+        # Indexed by local vertex id; list indexing is cheaper than dict lookups in the face loop
+        vertex_map = []
 
         source_vertices = mesh_data['vertices']
-        boundary_flags = selection_info.boundary_vertex_flags
-        vertex_orig_indices = selection_info.vertex_orig_indices
+        boundary_flags = selection_info.boundary_vertex_flags.tolist()
+        vertex_orig_indices = selection_info.vertex_orig_indices.tolist()
         orig_count = len(vertex_orig_indices)
 
-        from mathutils import kdtree, Vector
-        kd = None
+        from mathutils import kdtree
+        # Boundary verts whose original vertex was deleted snap to a surviving vert within epsilon
+        reuse_targets = {}
         if selection_info.selection_only and bm.verts:
-            kd = kdtree.KDTree(len(bm.verts))
-            for i, v in enumerate(bm.verts):
-                kd.insert(v.co, i)
-            kd.balance()
+            existing_co = mesh_co[remaining_ids]
             # scale-aware tiny epsilon
-            bbox_min = Vector((min(v.co.x for v in bm.verts),
-                               min(v.co.y for v in bm.verts),
-                               min(v.co.z for v in bm.verts)))
-            bbox_max = Vector((max(v.co.x for v in bm.verts),
-                               max(v.co.y for v in bm.verts),
-                               max(v.co.z for v in bm.verts)))
-            bbox_diag = (bbox_max - bbox_min).length
+            bbox_diag = float(np.linalg.norm(existing_co.max(axis=0) - existing_co.min(axis=0)))
             reuse_epsilon = max(1e-6, bbox_diag * 1e-8)
-        else:
-            reuse_epsilon = None
+
+            query_ids = [
+                local_idx for local_idx in range(min(orig_count, len(source_vertices)))
+                if boundary_flags[local_idx] and vertex_orig_indices[local_idx] not in index_lookup
+            ]
+            if query_ids:
+                existing_verts = list(bm.verts)
+                query_co = np.asarray(source_vertices, dtype=np.float64).reshape(-1, 3)[query_ids]
+                if HAS_SCIPY:
+                    # One batched C query instead of a kd.find() call per boundary vertex
+                    tree = cKDTree(existing_co)
+                    dists, idxs = tree.query(query_co, k=1, distance_upper_bound=reuse_epsilon)
+                    for local_idx, dist, idx in zip(query_ids, dists.tolist(), idxs.tolist()):
+                        if dist <= reuse_epsilon:
+                            reuse_targets[local_idx] = existing_verts[idx]
+                else:
+                    kd = kdtree.KDTree(len(existing_verts))
+                    for i, v in enumerate(existing_verts):
+                        kd.insert(v.co, i)
+                    kd.balance()
+                    # kd.find takes plain float triples; no temporary Vector per query
+                    for local_idx, co in zip(query_ids, query_co.tolist()):
+                        _, idx, dist = kd.find(co)
+                        if dist <= reuse_epsilon:
+                            reuse_targets[local_idx] = existing_verts[idx]
+
+        # Hot loops below: bind BMesh/container methods once and iterate plain Python lists
+        verts_new = bm.verts.new
+        faces_new = bm.faces.new
+        faces_get = bm.faces.get
+        vertex_map_append = vertex_map.append
+        reuse_get = reuse_targets.get
+        if hasattr(source_vertices, 'tolist'):
+            source_vertices = source_vertices.tolist()
+        source_faces = mesh_data['faces']
+        if hasattr(source_faces, 'tolist'):
+            source_faces = source_faces.tolist()
 
         for local_idx, coord in enumerate(source_vertices):
             # Vertices beyond orig_count are new vertices added by the engine (hole filling)
@@ -220,76 +333,43 @@ def _patch_selection(mesh_data, target_obj, selection_info: MeshExportResult):
                 is_boundary = False
 
             if is_boundary and orig_idx in index_lookup:
-                vertex_map[local_idx] = index_lookup[orig_idx]
+                vertex_map_append(index_lookup[orig_idx])
                 continue
 
-            if is_boundary and kd is not None:
-                co_vec = Vector(coord)
-                _, idx, dist = kd.find(co_vec)
-                bm.verts.ensure_lookup_table()
-                if dist <= reuse_epsilon and idx < len(bm.verts):
-                    match_vert = bm.verts[idx]
-                    if match_vert.is_valid:
-                        vertex_map[local_idx] = match_vert
-                        continue
-
-            vert = bm.verts.new(coord)
-            vert[vert_layer] = orig_idx if orig_idx >= 0 else -1
-            vertex_map[local_idx] = vert
+            match_vert = reuse_get(local_idx)
+            if match_vert is not None:
+                vertex_map_append(match_vert)
+                continue
 
-        bm.verts.ensure_lookup_table()
+            vert = verts_new(coord)
+            vert[vert_layer] = orig_idx if orig_idx >= 0 else -1
+            vertex_map_append(vert)
 
-        for face_indices in mesh_data['faces']:
+        for face_indices in source_faces:
             verts = [vertex_map[idx] for idx in face_indices]
             try:
-                new_face = bm.faces.new(verts)
+                new_face = faces_new(verts)
             except ValueError:
-                new_face = bm.faces.get(verts)
+                new_face = faces_get(verts)
                 if new_face is None:
                     raise
-            if new_face and face_layer is not None:
+            if new_face:
                 new_face[face_layer] = -1
 
         # Weld only in full-mesh replace; for selection patches, keep seam intact
         if not selection_info.selection_only:
             bmesh.ops.remove_doubles(bm, verts=bm.verts, dist=1e-6)
 
-        # Clear selection then select only newly created faces (face_layer == -1) for this session
-        for f in bm.faces:
-            f.select = False
-        for e in bm.edges:
-            e.select = False
-        for v in bm.verts:
-            v.select = False
-        new_faces = []
-        if face_layer is not None:
-            for f in bm.faces:
-                if f.is_valid and f[face_layer] == -1:
-                    f[session_layer] = current_session_id
-                    new_faces.append(f)
-                    f.select = True
-                    for e in f.edges:
-                        if e.is_valid:
-                            e.select = True
-                    for v in f.verts:
-                        if v.is_valid:
-                            v.select = True
-        # Normalize layer indices to avoid stale -1 across runs
-        bm.faces.ensure_lookup_table()
-        bm.verts.ensure_lookup_table()
-        for idx, face in enumerate(bm.faces):
-            face[face_layer] = idx
-        for idx, vert in enumerate(bm.verts):
-            vert[vert_layer] = idx
-        # Drop session layer to avoid accumulation between runs
-        try:
-            bm.faces.layers.int.remove(session_layer)
-        except Exception:
-            pass
         bm.normal_update()
         bm.to_mesh(mesh)
         mesh.validate(verbose=False)
         mesh.update(calc_edges=True, calc_edges_loose=True)
+        # Select only newly created faces (orig face == -1) and tag them for this session
+        _select_patch_faces(mesh, current_session_id)
+        # Normalize layer indices to avoid stale -1 across runs
+        _write_index_attribute(mesh, "meshrepair_orig_vert", 'POINT')
+        _write_index_attribute(mesh, "meshrepair_orig_face", 'FACE')
+        target_obj["_meshrepair_prev_session"] = current_session_id
     finally:
         try:
             vertex_map.clear()
@@ -306,6 +386,51 @@ def _patch_selection(mesh_data, target_obj, selection_info: MeshExportResult):
             pass
 
 
+def _select_patch_faces(mesh, session_id):
+    """Select faces whose meshrepair_orig_face is -1 (plus their edges/verts) and tag their session."""
+    poly_count = len(mesh.polygons)
+    loop_count = len(mesh.loops)
+
+    orig_face = np.empty(poly_count, dtype=np.int32)
+    mesh.attributes["meshrepair_orig_face"].data.foreach_get("value", orig_face)
+    face_select = orig_face == -1
+
+    session_ids = np.empty(poly_count, dtype=np.int32)
+    session_attr = mesh.attributes["meshrepair_session_id"]
+    session_attr.data.foreach_get("value", session_ids)
+    session_ids[face_select] = session_id
+    session_attr.data.foreach_set("value", session_ids)
+
+    # Spread the face mask to loops, then scatter onto the loops' verts and edges
+    loop_total = np.empty(poly_count, dtype=np.int32)
+    mesh.polygons.foreach_get("loop_total", loop_total)
+    loop_select = np.repeat(face_select, loop_total)
+    loop_verts = np.empty(loop_count, dtype=np.int32)
+    loop_edges = np.empty(loop_count, dtype=np.int32)
+    mesh.loops.foreach_get("vertex_index", loop_verts)
+    mesh.loops.foreach_get("edge_index", loop_edges)
+
+    vert_select = np.zeros(len(mesh.vertices), dtype=np.bool_)
+    vert_select[loop_verts[loop_select]] = True
+    edge_select = np.zeros(len(mesh.edges), dtype=np.bool_)
+    edge_select[loop_edges[loop_select]] = True
+
+    mesh.polygons.foreach_set("select", face_select)
+    mesh.edges.foreach_set("select", edge_select)
+    mesh.vertices.foreach_set("select", vert_select)
+
+
+def _write_index_attribute(mesh, name, domain):
+    """Set an INT mesh attribute to each element's own index, creating it if needed."""
+    attr = mesh.attributes.get(name)
+    if attr is not None and (attr.data_type != 'INT' or attr.domain != domain):
+        mesh.attributes.remove(attr)
+        attr = None
+    if attr is None:
+        attr = mesh.attributes.new(name, 'INT', domain)
+    attr.data.foreach_set("value", np.arange(len(attr.data), dtype=np.int32))
+
+
 def _remap_selection_metadata(result_mesh_data, selection_info: MeshExportResult):
     """
     Remap vertex_orig_indices and boundary flags to the engine-returned mesh order
@@ -317,26 +442,33 @@ def _remap_selection_metadata(result_mesh_data, selection_info: MeshExportResult
     orig_vertices = selection_info.mesh_data.get('vertices', [])
     orig_indices = selection_info.vertex_orig_indices
     orig_boundary = selection_info.boundary_vertex_flags
-    if not orig_vertices or not orig_indices or len(orig_indices) != len(orig_vertices):
+    if len(orig_vertices) == 0 or len(orig_indices) == 0 or len(orig_indices) != len(orig_vertices):
+        return
+
+    result_vertices = result_mesh_data.get('vertices', [])
+    result_count = len(result_vertices)
+    if result_count == 0:
+        selection_info.vertex_orig_indices = np.empty(0, dtype=np.int32)
+        selection_info.boundary_vertex_flags = np.empty(0, dtype=np.bool_)
         return
 
-    def key_from_coord(coord):
-        return (round(coord[0], 6), round(coord[1], 6), round(coord[2], 6))
-
-    lookup = {}
-    for idx, coord in enumerate(orig_vertices):
-        lookup[key_from_coord(coord)] = (orig_indices[idx], orig_boundary[idx])
-
-    new_orig_indices = []
-    new_boundary = []
-    for coord in result_mesh_data.get('vertices', []):
-        key = key_from_coord(coord)
-        if key in lookup:
-            orig_idx, is_boundary = lookup[key]
-        else:
-            orig_idx, is_boundary = -1, False
-        new_orig_indices.append(orig_idx)
-        new_boundary.append(is_boundary)
-
-    selection_info.vertex_orig_indices = new_orig_indices
-    selection_info.boundary_vertex_flags = new_boundary
+    # Quantize to 1e-6 integer keys (widened to float64 first so both sides round alike),
+    # then match rows exactly through one shared np.unique instead of a tuple-keyed dict.
+    orig_keys = np.round(np.asarray(orig_vertices, dtype=np.float64).reshape(-1, 3) * 1e6).astype(np.int64)
+    result_keys = np.round(np.asarray(result_vertices, dtype=np.float64).reshape(-1, 3) * 1e6).astype(np.int64)
+    orig_count = len(orig_keys)
+
+    _, inverse = np.unique(np.concatenate((orig_keys, result_keys)), axis=0, return_inverse=True)
+    inverse = inverse.reshape(-1)
+    slot = np.full(int(inverse.max()) + 1, -1, dtype=np.int64)
+    slot[inverse[:orig_count]] = np.arange(orig_count)
+    matched = slot[inverse[orig_count:]]
+    found = matched >= 0
+
+    orig_indices = np.asarray(orig_indices, dtype=np.int32)
+    orig_boundary = np.asarray(orig_boundary, dtype=np.bool_)
+    new_orig_indices = np.where(found, orig_indices[matched], -1)
+    new_boundary = found & orig_boundary[matched]
+
+    selection_info.vertex_orig_indices = np.asarray(new_orig_indices, dtype=np.int32)
+    selection_info.boundary_vertex_flags = np.asarray(new_boundary, dtype=np.bool_)
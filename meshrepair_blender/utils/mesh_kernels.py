@@ -0,0 +1,125 @@
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+"""
+Optional Numba kernels for mesh topology queries
+
+Numba is not bundled with Blender. When it cannot be imported HAS_NUMBA is
+False and callers keep their pure-Python code paths.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op stand-in so kernels stay importable without Numba."""
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+@njit(parallel=True, cache=True)
+def boundary_edge_mask(offsets, face_ids, scoped_mask, ignored_mask):
+    """
+    Flag edges whose non-ignored linked faces are both in and out of scope.
+
+    Args:
+        offsets: (E + 1,) int32 CSR offsets into face_ids
+        face_ids: int32 original face index of every edge/face link
+        scoped_mask: bool mask over original face indices
+        ignored_mask: bool mask over original face indices
+
+    Returns:
+        ndarray: (E,) bool edge mask
+    """
+    edge_count = len(offsets) - 1
+    out = np.zeros(edge_count, dtype=np.bool_)
+    for e in prange(edge_count):
+        in_scope = False
+        out_scope = False
+        for k in range(offsets[e], offsets[e + 1]):
+            f = face_ids[k]
+            if ignored_mask[f]:
+                continue
+            if scoped_mask[f]:
+                in_scope = True
+            else:
+                out_scope = True
+        out[e] = in_scope and out_scope
+    return out
+
+
+@njit(cache=True)
+def dilate_face_mask(seed_mask, offsets, neighbors, iterations):
+    """
+    Grow a face mask by breadth-first steps over face adjacency.
+
+    Args:
+        seed_mask: (F,) bool mask of the initial faces
+        offsets: (F + 1,) int32 CSR offsets into neighbors
+        neighbors: int32 adjacent face positions of every face
+        iterations: Number of rings to add
+
+    Returns:
+        ndarray: (F,) bool mask of the dilated face set
+    """
+    out = seed_mask.copy()
+    frontier = np.nonzero(seed_mask)[0]
+    next_frontier = np.empty(len(seed_mask), dtype=np.int64)
+    for _ in range(iterations):
+        count = 0
+        for f in frontier:
+            for k in range(offsets[f], offsets[f + 1]):
+                g = neighbors[k]
+                if not out[g]:
+                    out[g] = True
+                    next_frontier[count] = g
+                    count += 1
+        if count == 0:
+            break
+        frontier = next_frontier[:count].copy()
+    return out
+
+
+@njit(cache=True)
+def _find_root(parent, node):
+    """Union-find root lookup with path halving."""
+    while parent[node] != node:
+        parent[node] = parent[parent[node]]
+        node = parent[node]
+    return node
+
+
+@njit(cache=True)
+def count_edge_components(edges, vertex_count):
+    """
+    Count connected components of an edge list using union-find.
+
+    Args:
+        edges: (E, 2) int array of compact vertex ids in [0, vertex_count)
+        vertex_count: Number of distinct vertices referenced by edges
+
+    Returns:
+        int: Number of connected components
+    """
+    parent = np.arange(vertex_count)
+    components = vertex_count
+    for e in range(edges.shape[0]):
+        a = _find_root(parent, edges[e, 0])
+        b = _find_root(parent, edges[e, 1])
+        if a != b:
+            parent[a] = b
+            components -= 1
+    return components
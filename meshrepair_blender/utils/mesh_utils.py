@@ -19,13 +19,13 @@ import tempfile
 import os
 
 
-def export_mesh(obj, file_format='OBJ', selection_only=False):
+def export_mesh(obj, file_format='PLY', selection_only=False):
     """
     Export Blender mesh to temporary file.
 
     Args:
         obj: Blender object (must be MESH type)
-        file_format: 'OBJ' or 'PLY'
+        file_format: 'PLY' (binary, default) or 'OBJ'
         selection_only: Export only selected faces (Edit mode)
 
     Returns:
@@ -42,8 +42,9 @@ def export_mesh(obj, file_format='OBJ', selection_only=False):
     else:
         raise ValueError(f"Unsupported format: {file_format}")
 
-    # Create temporary file
-    temp_file = tempfile.mktemp(suffix=ext, prefix="meshrepair_")
+    # Create temporary file (atomically, unlike mktemp); prefer the in-memory temp dir
+    with tempfile.NamedTemporaryFile(suffix=ext, prefix="meshrepair_", delete=False, dir=get_temp_dir()) as tf:
+        temp_file = tf.name
 
     try:
         # Export based on format
@@ -61,7 +62,8 @@ def export_mesh(obj, file_format='OBJ', selection_only=False):
                 export_selected_objects=True,
                 export_uv=False,
                 export_normals=False,
-                export_colors='NONE'
+                export_colors='NONE',
+                ascii_format=False
             )
 
         return temp_file